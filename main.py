@@ -1,8 +1,17 @@
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox
+import atexit
+import json
+import math
+import multiprocessing
 import os
+import shutil
+import subprocess
+import tempfile
 from threading import Thread
-from typing import Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 # 导入 tkinterdnd2
 try:
@@ -18,6 +27,124 @@ try:
 except ImportError:
     PYDUB_AVAILABLE = False
 
+# 导入 numpy / scipy（向量化处理，缺失时回退到pydub逐步处理）
+try:
+    import numpy as np
+    from scipy import signal
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 导入 samplerate（libsamplerate重采样，比audioop更快且抗混叠，缺失时回退）
+try:
+    import samplerate
+    SAMPLERATE_AVAILABLE = True
+except ImportError:
+    SAMPLERATE_AVAILABLE = False
+
+# 导入 soundfile（libsndfile直接写WAV/FLAC，无子进程，缺失时回退）
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+
+# 导入 lameenc（进程内LAME编码MP3，省去ffmpeg子进程往返，缺失时回退）
+try:
+    import lameenc
+    LAMEENC_AVAILABLE = True
+except ImportError:
+    LAMEENC_AVAILABLE = False
+
+# 导入 numba（JIT编译热点内核，缺失时回退到NumPy/pydub路径）
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# 优先加载packing.py用Numba AOT预编译的内核模块，省去首次调用的JIT编译卡顿
+try:
+    from audio_kernels import downmix_i16, gain_i16
+    KERNELS_AVAILABLE = True
+except ImportError:
+    KERNELS_AVAILABLE = False
+
+if not KERNELS_AVAILABLE and NUMBA_AVAILABLE:
+    KERNELS_AVAILABLE = True
+
+    # cache=True持久化编译结果，避免GUI每次启动都付出首调编译开销
+    @njit(parallel=True, cache=True)
+    def downmix_i16(x):
+        """(n,2)的int16立体声按(L+R)//2合并为(n,)单声道"""
+        n = x.shape[0]
+        out = np.empty(n, dtype=np.int16)
+        for i in prange(n):
+            out[i] = (int(x[i, 0]) + int(x[i, 1])) >> 1
+        return out
+
+    @njit(parallel=True, cache=True)
+    def gain_i16(x, g):
+        """对int16数组施加线性增益并饱和截断，单次遍历融合乘法/截断/回写"""
+        out = np.empty_like(x)
+        for i in prange(x.size):
+            v = int(x[i] * g)
+            out[i] = -32768 if v < -32768 else (32767 if v > 32767 else v)
+        return out
+
+# 启动时解析一次ffmpeg/ffprobe路径，避免每次调用都扫描PATH
+_FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+_FFPROBE = shutil.which("ffprobe") or "ffprobe"
+if PYDUB_AVAILABLE:
+    AudioSegment.converter = _FFMPEG
+    AudioSegment.ffprobe = _FFPROBE
+
+# 支持的音频扩展名（与文件选择对话框保持一致）
+AUDIO_EXTENSIONS = {"wav", "mp3", "flac", "aac", "ogg"}
+
+# 解码后超过该大小的文件改走磁盘PCM+memmap，避免整段载入内存
+_MEMMAP_THRESHOLD = 256 * 1024 * 1024
+
+# 融合管线的分块帧数：单块各级缓冲合计保持在L2缓存量级
+_TILE_FRAMES = 1 << 16
+
+
+def _replace_samples(seg, arr):
+    """把NumPy处理结果直接写回AudioSegment的底层缓冲
+
+    _spawn会把数据再拷贝进新的array.array，交换期间内存翻倍；
+    直接赋值_data只保留tobytes()这一次必要分配。
+    """
+    seg._data = arr.tobytes()
+    return seg
+
+
+@lru_cache(maxsize=32)
+def _make_encoder(fmt: str, sample_width: int, channels: int, rate: int,
+                  extra: Tuple[str, ...]):
+    """按(格式,位宽,声道,采样率,参数)生成专用编码闭包并缓存
+
+    批量转换中该组合高度重复，缓存后每个文件复用已构建好的argv，
+    免去逐文件重新解析参数。
+    """
+    pcm_format = {1: "u8", 2: "s16le", 3: "s24le", 4: "s32le"}[sample_width]
+    cmd = [_FFMPEG, "-y",
+           "-f", pcm_format, "-ar", str(rate), "-ac", str(channels),
+           "-i", "pipe:0"]
+    cmd += list(extra)
+    cmd += ["-f", fmt]
+
+    def encode(raw: bytes, output_path: str) -> None:
+        # 直接写目标文件：ffmpeg对pipe:1无法回填WAV等容器的长度字段，
+        # 落盘可seek才能写出合规文件，也免得整个编码结果驻留内存
+        proc = subprocess.Popen(cmd + [output_path], stdin=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, bufsize=1 << 20)
+        proc.communicate(raw)
+        if proc.returncode != 0:
+            raise RuntimeError(f"ffmpeg编码失败(返回码{proc.returncode})")
+
+    return encode
+
 # ===== MODEL =====
 class AudioProcessor:
     """音频处理核心类（数据模型）"""
@@ -25,81 +152,409 @@ class AudioProcessor:
         self.audio = None  # 存储音频数据的pydub对象
         self.file_path = ""  # 原始文件路径
         self.original_format = ""  # 原始文件格式扩展名
+        self._pcm_map = None  # 大文件的np.memmap视图（操作系统按需分页）
+        self._pcm_tmp = ""  # memmap后备的临时PCM文件路径
+        # 进程退出时兜底清理临时PCM（正常流程在处理完成或重新加载时释放）
+        atexit.register(self._release_memmap)
 
     def load_audio(self, file_path: str) -> bool:
-        """加载音频文件并初始化音频对象"""
+        """加载音频文件并初始化音频对象，失败时原样抛出异常"""
+        self._release_memmap()
+        self.file_path = file_path
+        # 提取文件扩展名（不含点）
+        self.original_format = os.path.splitext(file_path)[1][1:].lower()
         try:
-            self.file_path = file_path
-            # 提取文件扩展名（不含点）
-            self.original_format = os.path.splitext(file_path)[1][1:].lower()  
+            # ffmpeg管道流式解码，跳过pydub的临时WAV中转
+            self.audio = self._ffmpeg_decode(file_path)
+        except Exception:
+            # ffmpeg/ffprobe不可用或解码失败时回退到pydub加载
             self.audio = AudioSegment.from_file(file_path)
-            return True
-        except Exception as e:
-            raise Exception(f"无法加载音频文件: {str(e)}")
+        return True
+
+    def _release_memmap(self) -> None:
+        """释放memmap视图并删除后备的临时PCM文件"""
+        self._pcm_map = None
+        if self._pcm_tmp:
+            try:
+                os.remove(self._pcm_tmp)
+            except OSError:
+                # Windows上若仍有映射句柄会拒绝删除，保留路径供下次调用/atexit重试
+                return
+            self._pcm_tmp = ""
+
+    def _ffmpeg_decode(self, file_path: str) -> "AudioSegment":
+        """用ffprobe探测参数后经ffmpeg管道解码为原始PCM"""
+        probe = subprocess.run(
+            [_FFPROBE, "-v", "quiet", "-select_streams", "a:0",
+             "-show_streams", "-of", "json", file_path],
+            capture_output=True, check=True)
+        stream = json.loads(probe.stdout)["streams"][0]
+        sample_rate = int(stream["sample_rate"])
+        channels = int(stream["channels"])
+
+        # 按源位深选择解码格式：超过16位的源走s32le，避免静默截断到16位
+        bits = int(stream.get("bits_per_raw_sample")
+                   or stream.get("bits_per_sample") or 0)
+        if bits > 16:
+            pcm_format, sample_width = "s32le", 4
+        else:
+            pcm_format, sample_width = "s16le", 2
+
+        # 预估解码后大小，超大文件解码到磁盘并memmap，按需分页而非整载内存
+        duration = float(stream.get("duration") or 0)
+        estimated = int(duration * sample_rate * channels * sample_width)
+        if NUMPY_AVAILABLE and estimated > _MEMMAP_THRESHOLD:
+            fd, tmp_path = tempfile.mkstemp(suffix=".pcm")
+            os.close(fd)
+            try:
+                subprocess.run(
+                    [_FFMPEG, "-y", "-i", file_path, "-f", pcm_format,
+                     "-ar", str(sample_rate), "-ac", str(channels), tmp_path],
+                    check=True, stderr=subprocess.DEVNULL)
+                dtype = {2: np.int16, 4: np.int32}[sample_width]
+                self._pcm_map = np.memmap(tmp_path, dtype=dtype, mode="r").reshape(-1, channels)
+            except Exception:
+                # 解码失败时_pcm_tmp还没接管，自行删掉刚建的临时文件
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+            self._pcm_tmp = tmp_path
+            # 元数据壳：真实样本在memmap里，get_audio_info/处理管线按_pcm_map分支
+            return AudioSegment(data=b"\x00" * (sample_width * channels),
+                                sample_width=sample_width,
+                                frame_rate=sample_rate, channels=channels)
+
+        proc = subprocess.Popen(
+            [_FFMPEG, "-i", file_path, "-f", pcm_format,
+             "-ar", str(sample_rate), "-ac", str(channels), "pipe:1"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=1 << 20)
+        raw = proc.stdout.read()
+        proc.wait()
+        if proc.returncode != 0 or not raw:
+            raise RuntimeError(f"ffmpeg解码失败(返回码{proc.returncode})")
+        return AudioSegment(data=raw, sample_width=sample_width,
+                            frame_rate=sample_rate, channels=channels)
 
     def get_audio_info(self) -> Dict[str, Any]:
         """获取音频信息"""
         if not self.audio:
             return {}
+        if self._pcm_map is not None:
+            # 大文件：时长/峰值直接在memmap视图上归约，不产生整块临时数组
+            peak = max(int(self._pcm_map.max()), -int(self._pcm_map.min()), 1)
+            duration = self._pcm_map.shape[0] / self.audio.frame_rate
+            full_scale = float(1 << (8 * self.audio.sample_width - 1))
+            max_dbfs = 20 * math.log10(peak / full_scale)
+        else:
+            duration = len(self.audio) / 1000.0
+            max_dbfs = self.audio.max_dBFS
         return {
             "声道数": self.audio.channels,
             "采样率": self.audio.frame_rate,
             "位深度": self.audio.sample_width * 8,
-            "时长(秒)": len(self.audio) / 1000.0,
-            "最大音量(dBFS)": self.audio.max_dBFS,
+            "时长(秒)": duration,
+            "最大音量(dBFS)": max_dbfs,
             "原始格式": self.original_format
         }
 
     def process_audio(self, params: Dict[str, Any], progress_callback=None) -> bool:
-        """处理音频"""
-        try:
+        """处理音频，失败时原样抛出异常（由调用方的工作进程统一捕获上报）"""
+        if NUMPY_AVAILABLE:
+            # NumPy可用时单次遍历完成前三步，省去中间缓冲拷贝
+            steps = [
+                (self._process_fused, 10, 70),
+                (self._process_export, 70, 100)
+            ]
+        else:
             steps = [
                 (self._process_channels, 10, 30),
                 (self._process_normalization, 30, 50),
                 (self._process_sample_rate, 50, 70),
                 (self._process_export, 70, 100)
             ]
-            
-            for step_func, start, end in steps:
-                step_func(params)
-                if progress_callback:
-                    progress_callback(start + (end - start)//2)
-            
-            return True
-        except Exception as e:
-            raise Exception(f"处理失败: {str(e)}")
+
+        for step_func, start, end in steps:
+            step_func(params)
+            if progress_callback:
+                progress_callback(start + (end - start)//2)
+
+        return True
     
     def _process_channels(self, params):
+        # 仅作为无NumPy环境及特殊位深的回退；常规路径在_process_fused里合并声道
         if params.get("mono", False):
             self.audio = self.audio.set_channels(1)
+
+    @staticmethod
+    def _downmix_tile(tile, ch, dtype):
+        """把一块(n,ch)样本按左右平均合并为(n,1)单声道"""
+        if ch == 2:
+            if KERNELS_AVAILABLE and dtype is np.int16:
+                # Numba并行内核：整数加法+右移，单次遍历完成
+                return downmix_i16(np.ascontiguousarray(tile)).reshape(-1, 1)
+            # 整数加法+右移求平均，避免mean产生float64中间数组
+            # 32位输入相加会溢出int32回绕，改用int64累加
+            acc = np.int64 if dtype is np.int32 else np.int32
+            tmp = np.add(tile[:, 0], tile[:, 1], dtype=acc)
+            np.right_shift(tmp, 1, out=tmp)
+            return tmp.astype(dtype).reshape(-1, 1)
+        acc = np.int64 if dtype is np.int32 else np.int32
+        return tile.mean(axis=1, dtype=acc).astype(dtype).reshape(-1, 1)
     
     def _process_normalization(self, params):
-        if params.get("normalize", False) and params.get("normalize_value"):
-            target_db = float(params["normalize_value"])
-            change_in_db = target_db - self.audio.max_dBFS
-            self.audio = self.audio.apply_gain(change_in_db)
+        # 仅作为无NumPy环境及特殊位深的回退；常规路径在_process_fused里向量化
+        if not (params.get("normalize", False) and params.get("normalize_value")):
+            return
+        target_db = float(params["normalize_value"])
+        change_in_db = target_db - self.audio.max_dBFS
+        self.audio = self.audio.apply_gain(change_in_db)
     
     def _process_sample_rate(self, params):
-        if params.get("sample_rate"):
-            new_sample_rate = int(params["sample_rate"])
-            self.audio = self.audio.set_frame_rate(new_sample_rate)
-    
+        # 仅作为无NumPy环境及特殊位深的回退；常规路径在_process_fused里用libsamplerate
+        if not params.get("sample_rate"):
+            return
+        new_sample_rate = int(params["sample_rate"])
+        if new_sample_rate == self.audio.frame_rate:
+            return
+        self.audio = self.audio.set_frame_rate(new_sample_rate)
+
+    def _process_fused(self, params):
+        """分块融合处理：每块在缓存内完成声道合并、增益和重采样再写出
+
+        按_TILE_FRAMES分块遍历，一个块的输入/中间/输出缓冲常驻L2缓存，
+        避免三次全量遍历把带宽耗在DRAM上；重采样用有状态的
+        samplerate.Resampler跨块保持滤波器状态。
+        """
+        sw = self.audio.sample_width
+        ch = self.audio.channels
+        dtype = {1: np.int8, 2: np.int16, 4: np.int32}.get(sw)
+        if dtype is None:
+            # 24位等特殊位深无对应NumPy类型，回退到pydub逐步处理
+            self._process_channels(params)
+            self._process_normalization(params)
+            self._process_sample_rate(params)
+            return
+
+        full_scale = float(1 << (8 * sw - 1))
+        lo, hi = -full_scale, full_scale - 1
+        if self._pcm_map is not None:
+            buf = self._pcm_map  # 磁盘后备视图，操作系统按需分页读入
+        else:
+            buf = np.frombuffer(self.audio.raw_data, dtype=dtype).reshape(-1, ch)
+        n = buf.shape[0]
+
+        to_mono = params.get("mono", False) and ch > 1
+        out_ch = 1 if to_mono else ch
+
+        # 峰值增益需要全局峰值，先做一次纯归约；峰值必须取自合并后的信号，
+        # 与逐步处理路径（先合并声道、再标准化）保持一致
+        gain = None
+        if n and params.get("normalize", False) and params.get("normalize_value"):
+            target_db = float(params["normalize_value"])
+            if to_mono:
+                peak = 1
+                for t0 in range(0, n, _TILE_FRAMES):
+                    mono = self._downmix_tile(buf[t0:t0 + _TILE_FRAMES], ch, dtype)
+                    peak = max(peak, int(mono.max()), -int(mono.min()))
+            else:
+                peak = max(int(buf.max()), -int(buf.min()), 1)
+            gain = np.float32(math.pow(10.0, (target_db - 20 * math.log10(peak / full_scale)) / 20))
+
+        frame_rate = self.audio.frame_rate
+        new_rate = int(params["sample_rate"]) if params.get("sample_rate") else frame_rate
+        resampler = None
+        if new_rate != frame_rate and SAMPLERATE_AVAILABLE:
+            resampler = samplerate.Resampler("sinc_fastest", channels=out_ch)
+            ratio = new_rate / frame_rate
+
+        out_chunks = []
+        result = None
+        if new_rate == frame_rate:
+            # 输出长度已知：直接写入预分配缓冲，免去chunk列表+concatenate的双份驻留
+            result = np.empty((n, out_ch), dtype=dtype)
+
+        for t0 in range(0, n, _TILE_FRAMES):
+            last = t0 + _TILE_FRAMES >= n
+            tile = buf[t0:t0 + _TILE_FRAMES]
+
+            # 声道合并（左右平均）
+            if to_mono:
+                tile = self._downmix_tile(tile, ch, dtype)
+
+            # 音量峰值标准化
+            if gain is not None:
+                if KERNELS_AVAILABLE and sw == 2:
+                    tile = gain_i16(np.ascontiguousarray(tile).ravel(), gain).reshape(-1, out_ch)
+                else:
+                    tile = np.clip(tile.astype(np.float32) * gain, lo, hi).astype(dtype)
+
+            # 重采样（跨块保持滤波器状态）
+            if resampler is not None:
+                x = resampler.process(tile.astype(np.float32) / full_scale,
+                                      ratio, end_of_input=last)
+                tile = np.clip(np.asarray(x).reshape(-1, out_ch) * full_scale,
+                               lo, hi).astype(dtype)
+
+            if result is not None:
+                result[t0:t0 + tile.shape[0]] = tile.reshape(-1, out_ch)
+            else:
+                out_chunks.append(np.ascontiguousarray(tile))
+
+        if result is None:
+            if out_chunks:
+                result = out_chunks[0] if len(out_chunks) == 1 else np.concatenate(out_chunks)
+                out_chunks.clear()  # 尽早放掉分块引用，不与拼接结果双份共存
+            else:
+                result = np.empty((0, out_ch), dtype=dtype)
+
+        # samplerate缺失时退回scipy整段重采样
+        if new_rate != frame_rate and resampler is None:
+            result = signal.resample_poly(result.astype(np.float32), new_rate, frame_rate, axis=0)
+            result = np.clip(result, lo, hi).astype(dtype)
+
+        # 直接改写现有AudioSegment的缓冲和元数据，跳过构造新对象时的整块拷贝
+        _replace_samples(self.audio, np.ascontiguousarray(result))
+        self.audio.frame_rate = new_rate
+        self.audio.channels = out_ch
+        self.audio.frame_width = out_ch * sw
+        # 先放掉指向memmap的局部视图，否则Windows上删除后备文件会报PermissionError
+        buf = tile = None
+        self._release_memmap()  # 处理结果已落入self.audio，释放磁盘后备
+
+    @staticmethod
+    def _ffmpeg_encode(raw: bytes, rate: int, channels: int, sample_width: int,
+                       fmt: str, params: Dict[str, Any]) -> None:
+        """用ffmpeg把原始PCM编码写入目标文件，避免pydub的临时WAV中转"""
+        # 格式专属编码参数
+        extra = ()
+        if fmt == "mp3" and params.get("bitrate"):
+            extra = ("-b:a", f"{params['bitrate']}k")
+        elif fmt == "flac" and params.get("compression"):
+            extra = ("-compression_level", str(params["compression"]))
+        _make_encoder(fmt, sample_width, channels, rate, extra)(
+            raw, params["output_path"])
+
+    def _lame_encode(self, params: Dict[str, Any]) -> bytes:
+        """用lameenc在进程内编码MP3，省去ffmpeg子进程和管道往返"""
+        encoder = lameenc.Encoder()
+        encoder.set_bit_rate(int(params.get("bitrate") or 192))
+        encoder.set_in_sample_rate(self.audio.frame_rate)
+        encoder.set_channels(self.audio.channels)
+        encoder.set_quality(2)
+        return encoder.encode(self.audio.raw_data) + encoder.flush()
+
+    def _soundfile_write(self, params: Dict[str, Any]) -> None:
+        """用soundfile(libsndfile)直接写WAV/FLAC，无子进程和临时文件"""
+        output_format = params["output_format"]
+        dtype = {2: np.int16, 4: np.int32}[self.audio.sample_width]
+        arr = np.frombuffer(self.audio.raw_data, dtype=dtype).reshape(-1, self.audio.channels)
+
+        bit_depth = int(params.get("bit_depth") or self.audio.sample_width * 8)
+        subtype = {16: "PCM_16", 24: "PCM_24", 32: "PCM_32"}.get(bit_depth, "PCM_16")
+        kwargs = {}
+        if output_format == "flac":
+            if subtype == "PCM_32":  # FLAC最高支持24位
+                subtype = "PCM_24"
+            if params.get("compression"):
+                # libsndfile的压缩等级取0.0-1.0，按flac的0-8等级折算
+                kwargs["compression_level"] = int(params["compression"]) / 8.0
+        sf.write(params["output_path"], arr, self.audio.frame_rate,
+                 subtype=subtype, format=output_format.upper(), **kwargs)
+
     def _process_export(self, params):
         output_format = params["output_format"]
-        export_params = {}
-        
+
+        if (output_format in ("wav", "flac") and SOUNDFILE_AVAILABLE
+                and NUMPY_AVAILABLE and self.audio.sample_width in (2, 4)):
+            # libsndfile写入：位深转换由subtype指定，无需先set_sample_width
+            self._soundfile_write(params)
+            return
+
         # WAV格式特殊处理：在导出前设置位深度
         if output_format == "wav" and params.get("bit_depth"):
             self.audio = self.audio.set_sample_width(int(params["bit_depth"]) // 8)
-        
-        # 其他格式保持原有处理
-        elif output_format == "mp3" and params.get("bitrate"):
-            export_params["bitrate"] = params["bitrate"]
-        elif output_format == "flac" and params.get("compression"):
-            export_params["compression"] = params["compression"]
-        
-        # 移除sample_width参数
-        self.audio.export(params["output_path"], format=output_format, **export_params)
+
+        if (output_format == "mp3" and LAMEENC_AVAILABLE
+                and self.audio.sample_width == 2):
+            # lameenc仅支持16位PCM输入
+            encoded = self._lame_encode(params)
+            with open(params["output_path"], "wb") as f:
+                f.write(encoded)
+        else:
+            # PCM从stdin送入，编码结果由ffmpeg直接写出目标文件
+            self._ffmpeg_encode(
+                self.audio.raw_data, self.audio.frame_rate, self.audio.channels,
+                self.audio.sample_width, output_format, params)
+
+    @classmethod
+    def process_batch(cls, paths: List[str], params: Dict[str, Any],
+                      progress_value=None) -> List[str]:
+        """用进程池并行处理多个文件，返回失败文件的错误列表
+
+        params只含基本类型，可直接pickle到子进程；完成计数写入
+        progress_value共享计数器供界面轮询。
+        """
+        errors = []
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+            futures = {pool.submit(_process_one, path, params): path for path in paths}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(f"{os.path.basename(path)}: {e}")
+                if progress_value is not None:
+                    with progress_value.get_lock():
+                        progress_value.value += 1
+        return errors
+
+def _process_one(path: str, params: Dict[str, Any]) -> None:
+    """批量处理单个文件（在进程池子进程中执行）"""
+    processor = AudioProcessor()
+    try:
+        processor.load_audio(path)
+        file_params = dict(params)
+        name = os.path.splitext(os.path.basename(path))[0]
+        file_params["output_path"] = os.path.join(
+            params["output_dir"], f"{name}_processed.{params['output_format']}")
+        processor.process_audio(file_params)
+    finally:
+        processor._release_memmap()
+
+
+def _batch_worker(paths: List[str], params: Dict[str, Any],
+                  progress_value, result_queue) -> None:
+    """批量调度函数（在后台线程中运行）：驱动进程池并上报结果"""
+    try:
+        errors = AudioProcessor.process_batch(paths, params, progress_value)
+        result_queue.put(("done", errors))
+    except Exception as e:
+        result_queue.put(("error", str(e)))
+
+
+def _process_worker(file_path: str, params: Dict[str, Any],
+                    progress_value, result_queue) -> None:
+    """子进程工作函数：独立加载并处理音频，进度写共享计数器、结果走队列
+
+    在独立进程中运行以绕开GIL；进度只是覆写一个共享int，由主进程
+    以20Hz轮询刷新，不再每步向Tk事件队列投递回调。
+    """
+    processor = AudioProcessor()
+    try:
+        processor.load_audio(file_path)
+
+        def report(value):
+            progress_value.value = value
+
+        processor.process_audio(params, report)
+        result_queue.put(("done", None))
+    except Exception as e:
+        result_queue.put(("error", str(e)))
+    finally:
+        processor._release_memmap()
+
 
 # ===== CONTROLLER =====
 class AudioProcessorController:
@@ -118,15 +573,11 @@ class AudioProcessorController:
             self.model.load_audio(file_path)
             self.view.update_audio_info(self.model.get_audio_info())
         except Exception as e:
-            self.view.show_message("错误", str(e))
+            self.view.show_message("错误", f"无法加载音频文件: {e}")
 
         
-    def process_audio(self, params: Dict[str, Any]) -> None:
-        """处理音频"""
-        if not self.model.file_path:
-            return self.view.show_message("错误", "请先选择音频文件")
-        
-        # 验证标准化
+    def _validate_normalize(self, params: Dict[str, Any]) -> bool:
+        """验证标准化音量值，非法时弹出提示"""
         if params.get("normalize") and params.get("normalize_value"):
             try:
                 db_value = float(params["normalize_value"])
@@ -134,8 +585,18 @@ class AudioProcessorController:
                     raise ValueError("必须为负值")
             except ValueError as e:
                 error_msg = "必须为数字" if "could not convert" in str(e) else str(e)
-                return self.view.show_message("错误", f"音量值{error_msg}")
-        
+                self.view.show_message("错误", f"音量值{error_msg}")
+                return False
+        return True
+
+    def process_audio(self, params: Dict[str, Any]) -> None:
+        """处理音频"""
+        if not self.model.file_path:
+            return self.view.show_message("错误", "请先选择音频文件")
+
+        if not self._validate_normalize(params):
+            return
+
         if self.processing:
             return
 
@@ -148,32 +609,110 @@ class AudioProcessorController:
             return
         
         
-        # 启动处理线程
+        # 启动处理子进程（独立进程绕开GIL，Tk事件循环保持响应）
         self.processing = True
         self.view.set_processing_state(True)  # 更新UI状态
         self.view.reset_progress()
-        
-        def process_thread():
-            """后台处理线程"""
-            try:
-                # 调用模型处理并传递进度回调
-                self.model.process_audio(params, self.view.update_progress)
-                # 使用after方法更新UI线程
-                self.view.master.after(0, lambda: [
-                    self.view.show_message("成功", "处理完成"),
-                    self.view.update_progress(100)
-                ])
-            except Exception as e:
-                self.view.master.after(0, lambda err=str(e): self.view.show_message("错误", err))
-            finally:
-                # 清理状态
-                self.processing = False
-                self.view.master.after(0, lambda: [
-                    self.view.set_processing_state(False),
-                    self.view.reset_progress()
-                ])
-        
-        Thread(target=process_thread).start()
+
+        progress_value = multiprocessing.Value('i', 0)
+        result_queue = multiprocessing.Queue()
+        worker = multiprocessing.Process(
+            target=_process_worker,
+            args=(self.model.file_path, params, progress_value, result_queue),
+            daemon=True)
+        worker.start()
+        self._poll_worker(worker, progress_value, result_queue)
+
+    def _poll_worker(self, worker, progress_value, result_queue) -> None:
+        """以20Hz轮询共享进度计数器和结果队列"""
+        self.view.update_progress(progress_value.value)
+        result = None
+        while not result_queue.empty():
+            result = result_queue.get_nowait()
+        if result is None:
+            if worker.is_alive():
+                self.view.master.after(
+                    50, lambda: self._poll_worker(worker, progress_value, result_queue))
+                return
+            # 结果可能在存活检查前一刻才入队，确认退出后再取一次
+            while not result_queue.empty():
+                result = result_queue.get_nowait()
+        if result is None:
+            # 子进程未上报结果即退出
+            result = ("error", f"处理进程异常退出(代码{worker.exitcode})")
+
+        kind, value = result
+        if kind == "done":
+            self.view.show_message("成功", "处理完成")
+            self.view.update_progress(100)
+        else:
+            self.view.show_message("错误", value)
+        # 清理状态
+        self.processing = False
+        self.view.set_processing_state(False)
+        self.view.reset_progress()
+
+    def process_folder(self, folder: str, params: Dict[str, Any]) -> None:
+        """批量处理文件夹内的全部音频文件"""
+        if self.processing:
+            return
+        if not self._validate_normalize(params):
+            return
+
+        paths = [os.path.join(folder, name) for name in sorted(os.listdir(folder))
+                 if os.path.splitext(name)[1][1:].lower() in AUDIO_EXTENSIONS]
+        if not paths:
+            return self.view.show_message("错误", "文件夹中没有音频文件")
+
+        output_dir = self.view.ask_output_dir()
+        if not output_dir:  # 用户取消
+            return
+        params["output_dir"] = output_dir
+
+        # 启动批量处理子进程（内部用进程池按CPU核数并行）
+        self.processing = True
+        self.view.set_processing_state(True)
+        self.view.reset_progress()
+
+        progress_value = multiprocessing.Value('i', 0)
+        result_queue = multiprocessing.Queue()
+        # 并行由进程池的子进程提供；调度用线程即可——daemon进程不允许再生子进程，
+        # 套一层Process反而会让pool.submit直接失败
+        worker = Thread(target=_batch_worker,
+                        args=(paths, params, progress_value, result_queue),
+                        daemon=True)
+        worker.start()
+        self._poll_batch(worker, progress_value, result_queue, len(paths))
+
+    def _poll_batch(self, worker, progress_value, result_queue, total: int) -> None:
+        """在Tk事件循环中轮询批量处理进度"""
+        self.view.update_progress(progress_value.value * 100 // total)
+        result = None
+        while not result_queue.empty():
+            result = result_queue.get_nowait()
+        if result is None:
+            if worker.is_alive():
+                self.view.master.after(
+                    50, lambda: self._poll_batch(worker, progress_value, result_queue, total))
+                return
+            # 结果可能在存活检查前一刻才入队，确认退出后再取一次
+            while not result_queue.empty():
+                result = result_queue.get_nowait()
+        if result is None:
+            result = ("error", "处理线程异常退出")
+
+        kind, value = result
+        if kind == "done":
+            if value:
+                self.view.show_message("错误", "部分文件处理失败:\n" + "\n".join(value))
+            else:
+                self.view.show_message("成功", f"已处理{total}个文件")
+            self.view.update_progress(100)
+        else:
+            self.view.show_message("错误", value)
+        self.processing = False
+        self.view.set_processing_state(False)
+        self.view.reset_progress()
 
 # ===== VIEW =====
 class AudioProcessorView:
@@ -224,6 +763,8 @@ class AudioProcessorView:
     def _create_file_frame(self, parent):
         self.btn_choose = ttk.Button(parent, text="选择文件", command=self._on_choose_file)
         self.btn_choose.pack(side=tk.LEFT, padx=5, pady=5)
+        self.btn_folder = ttk.Button(parent, text="批量处理文件夹", command=self._on_choose_folder)
+        self.btn_folder.pack(side=tk.LEFT, padx=5, pady=5)
         self.lbl_file_path = ttk.Label(parent, text="未选择文件")
         self.lbl_file_path.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5, pady=5)
 
@@ -327,8 +868,18 @@ class AudioProcessorView:
             self.lbl_file_path.config(text=os.path.basename(file_path))
             self.controller.load_audio(file_path)
 
+    def _on_choose_folder(self) -> None:
+        """批量处理文件夹按钮点击事件"""
+        folder = filedialog.askdirectory(title="选择音频文件夹")
+        if folder:
+            self.controller.process_folder(folder, self._collect_params())
+
     def _on_process(self) -> None:
         """处理按钮点击事件"""
+        self.controller.process_audio(self._collect_params())
+
+    def _collect_params(self) -> Dict[str, Any]:
+        """从界面控件收集处理参数"""
         params = {
             "mono": self.var_mono.get(),
             "normalize": self.var_normalize.get(),
@@ -345,8 +896,8 @@ class AudioProcessorView:
             params["bitrate"] = self.mp3_bitrate.get()
         elif fmt == "flac":
             params["compression"] = self.flac_compression.get()
-        
-        self.controller.process_audio(params)
+
+        return params
 
     def update_audio_info(self, info: Dict[str, Any]) -> None:
         """更新音频信息"""
@@ -357,17 +908,18 @@ class AudioProcessorView:
         self.txt_info.config(state=tk.DISABLED)
 
     def update_progress(self, value: int) -> None:
-        """更新进度条"""
-        self.master.after(0, lambda: self.progress.configure(value=value))
+        """更新进度条（仅在Tk主线程的轮询循环中调用，无需after中转）"""
+        self.progress.configure(value=value)
 
     def reset_progress(self) -> None:
         """重置进度条"""
-        self.master.after(0, lambda: self.progress.configure(value=0))
+        self.progress.configure(value=0)
 
     def set_processing_state(self, processing: bool) -> None:
         """设置处理状态"""
         state = tk.DISABLED if processing else "readonly"
         self.btn_choose.config(state=state)
+        self.btn_folder.config(state=state)
         self.btn_process.config(state=state)
         self.format_combobox.config(state=state)
         self.sample_rate_combobox.config(state=state)
@@ -392,6 +944,10 @@ class AudioProcessorView:
             filetypes=[(f"{format_type.upper()}文件", f"*.{format_type}")]
         )
 
+    def ask_output_dir(self) -> Optional[str]:
+        """获取批量处理的输出文件夹"""
+        return filedialog.askdirectory(title="选择输出文件夹")
+
     def show_message(self, title: str, message: str) -> None:
         """显示消息"""
         if title == "错误":
@@ -401,6 +957,7 @@ class AudioProcessorView:
 
 # ===== 主程序 =====
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller打包后子进程需要
     root = TkinterDnD.Tk() if use_dnd else tk.Tk()
     app = AudioProcessorView(root)
     root.mainloop()
\ No newline at end of file
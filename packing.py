@@ -4,17 +4,57 @@ import subprocess
 import sys
 import shutil
 
+def build_kernels():
+    """用Numba AOT预编译热点内核为共享库，应用启动时直接加载，免去JIT编译卡顿"""
+    print("预编译Numba内核...")
+    try:
+        import numpy as np
+        from numba.pycc import CC
+    except ImportError:
+        print("未安装numba，跳过内核预编译（运行时回退到JIT）")
+        return None
+
+    cc = CC("audio_kernels")
+
+    @cc.export("downmix_i16", "i2[:](i2[:,:])")
+    def downmix_i16(x):
+        n = x.shape[0]
+        out = np.empty(n, dtype=np.int16)
+        for i in range(n):
+            out[i] = (int(x[i, 0]) + int(x[i, 1])) >> 1
+        return out
+
+    @cc.export("gain_i16", "i2[:](i2[:], f4)")
+    def gain_i16(x, g):
+        out = np.empty_like(x)
+        for i in range(x.size):
+            v = int(x[i] * g)
+            out[i] = -32768 if v < -32768 else (32767 if v > 32767 else v)
+        return out
+
+    cc.compile()
+    # 找到生成的共享库（Linux为.so，Windows为.pyd）
+    for name in os.listdir("."):
+        if name.startswith("audio_kernels") and name.endswith((".so", ".pyd")):
+            return name
+    return None
+
 def main():
     # 确保所有依赖已安装
     print("安装依赖...")
-    subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller", "pydub", "tkinterdnd2"])
-    
+    subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller",
+                    "pydub", "tkinterdnd2", "numpy", "scipy", "samplerate",
+                    "numba", "lameenc", "soundfile>=0.13"])
+
     # 创建hook文件
     print("创建hook文件...")
     with open("hook-tkinterdnd2.py", "w") as f:
         f.write("from PyInstaller.utils.hooks import collect_data_files\n")
         f.write("datas = collect_data_files('tkinterdnd2')\n")
-    
+
+    # 预编译内核
+    kernel_lib = build_kernels()
+
     # 运行pyinstaller
     print("开始打包...")
     cmd = [
@@ -24,11 +64,14 @@ def main():
         "--onefile",
         "--additional-hooks-dir=.",
         # "--add-data", "ffmpeg/*;.",
-        "--icon=icon.ico", 
+        "--icon=icon.ico",
         "main.py"  # 替换为你的主脚本文件名
     ]
+    if kernel_lib:
+        # 把预编译内核随包分发，main.py里import audio_kernels直接命中
+        cmd[1:1] = ["--add-binary", f"{kernel_lib}{os.pathsep}."]
     subprocess.run(cmd)
-    
+
     print("打包完成！可执行文件位于dist目录。")
 
 if __name__ == "__main__":